@@ -26,14 +26,23 @@ Methods:
         Returns another instance with the same value. 
         Use this rather than an assignment.
 
-Also provides the following function:
+Also provides the following functions:
 def distances(distance, n_steps):
     Returns an array of distances (as floating point inches)
     marking off <distance> into <n_steps> equal length segments
     starting at 0 and going up to distance.
+def gap_grid(openings, gauges, members):
+    Returns a list of (opening, gauge, n_members, gap) tuples (all
+    distances as floating point inches,) one for every combination
+    of the three iterables provided.
+def planner(openings, gauges, members, min_gap=None, max_gap=None,
+            accuracy=None, tollerance=TOLLERANCE):
+    Returns a list of strings, one for each usable entry of the
+    gap_grid, suitable for passing directly to tabulate().
 """
 
 import math
+import itertools
 
 TOLLERANCE = 0.00001
 
@@ -170,6 +179,9 @@ class Distance(object):
         fraction, decimal = divmod(decimal * accuracy, 1)
         if decimal >= 0.5:
             fraction += 1
+        if fraction == accuracy:  # Rounded up to a whole inch.
+            inches += 1
+            fraction = 0
         while fraction % 2 == 0 and fraction > 0:
             fraction /= 2
             accuracy /= 2
@@ -215,17 +227,14 @@ def lay_out(span, gauge, n_spaces):
         span = Distance(*span)
     if type(gauge) == tuple:
         gauge = Distance(*gauge)
-    gap =  (span - gauge * (n_spaces -1)) / n
+    gap =  (span - gauge * (n_spaces -1)) / n_spaces
     ret = []
     ret.append(Distance(0, 0))
-    running_total = gap.new()
-    ret.append(running_total.new())
-    while running_total < span:
-        running_total += gauge
-        ret.append(running_total.new())
-        running_total += gap
-        ret.append(running_total.new())
-    assert(running_total == span)
+    for i in range(1, n_spaces):
+        # Each side of the i'th divider:
+        ret.append(gap * i + gauge * (i - 1))
+        ret.append(gap * i + gauge * i)
+    ret.append(span.new())
     return ret
 
 
@@ -242,15 +251,144 @@ def test():
                                 .format(di.show(),
                                         di.show(inches_only = True)))
 
+def _inches(distance):
+    """Converts a Distance, a tuple suitable for making one, or a
+    number (taken to be inches) into floating point inches.
+    """
+    if isinstance(distance, Distance):
+        return distance.value
+    if type(distance) == tuple:
+        return Distance(*distance).value
+    return float(distance)
+
+def gap_grid(openings, gauges, members):
+    """Returns a list of (opening, gauge, n_members, gap) tuples.
+
+    <openings> and <gauges> are iterables of Distance instances, tuples
+    suitable for turning into instances there of, or numbers (inches.)
+    <members> is an iterable of integer cross member counts;
+    a negative or fractional count raises ValueError.
+    Each opening is spanned by n_members cross members, each of the
+    given gauge, leaving n_members + 1 equal gaps.
+    All values are converted to floating point inches once and every
+    combination is then computed in a single pass so that whole
+    catalogs of openings and gauges can be planned without creating
+    a Distance instance for each entry.  Returned distances are
+    floating point inches.
+    """
+    openings = [_inches(opening) for opening in openings]
+    gauges = [_inches(gauge) for gauge in gauges]
+    members = list(members)
+    for n in members:
+        if n != int(n):
+            raise ValueError(
+                "Number of cross members must be whole: {}".format(n))
+        if n < 0:
+            raise ValueError(
+                "Number of cross members can't be negative: {}".format(n))
+    members = [int(n) for n in members]
+    return [(opening, gauge, n, (opening - gauge * n) / (n + 1))
+            for opening, gauge, n
+            in itertools.product(openings, gauges, members)]
+
+def planner(openings, gauges, members, min_gap=None, max_gap=None,
+            accuracy=None, tollerance=TOLLERANCE):
+    """Returns a list of strings, one for each usable gap_grid entry.
+
+    Parameters are as for gap_grid() with the following filters:
+    Gaps less than <min_gap> or greater than <max_gap> (either of
+    which can be a Distance, a tuple or inches) are dropped.  Gaps
+    with no room at all (zero or less) are always dropped.
+    If <accuracy> is provided (ie 16 for 1/16ths) only gaps that come
+    out to within <tollerance> of an exact multiple of 1/<accuracy>
+    inch are kept and they are shown to that accuracy.
+    Each returned string reads:
+        <opening> opening, <gauge> gauge, <n> member(s): <gap> gaps
+    with distances shown in inches (and fractions) and columns padded
+    to line up so the list can be passed directly to tabulate().
+    """
+    lower = 0 if min_gap is None else _inches(min_gap)
+    upper = None if max_gap is None else _inches(max_gap)
+    grid = gap_grid(openings, gauges, members)
+    accuracy_filter = bool(accuracy)
+    accuracy = accuracy or 16
+    kept = []
+    for opening, gauge, n, gap in grid:
+        if gap <= 0 or gap < lower - tollerance:
+            continue
+        if upper is not None and gap > upper + tollerance:
+            continue
+        steps = gap * accuracy  # Gap in 1/<accuracy>ths of an inch.
+        if accuracy_filter and abs(steps - round(steps)) > (
+                                            tollerance * accuracy):
+            continue
+        kept.append((opening, gauge, n, math.floor(steps + 0.5)))
+    if not kept:
+        return []
+    # Openings, gauges, member counts and rounded gaps all repeat
+    # throughout a catalog so each distinct one is formatted (and
+    # padded) only once rather than once per row.
+    columns = [{}, {}, {}, {}]
+    for row in kept:
+        for column, value in zip(columns, row):
+            column[value] = None
+    for value in columns[0]:
+        columns[0][value] = Distance(0, value).show(inches_only=True)
+    for value in columns[1]:
+        columns[1][value] = Distance(0, value).show(inches_only=True)
+    for n in columns[2]:
+        columns[2][n] = "{} member{}".format(n, '' if n == 1 else 's')
+    for steps in columns[3]:
+        columns[3][steps] = Distance(0, steps / accuracy).show(
+                                inches_only=True, accuracy=accuracy)
+    for column in columns:
+        width = max(len(text) for text in column.values())
+        for value in column:
+            column[value] = '{:>{}}'.format(column[value], width)
+    opening_col, gauge_col, members_col, gap_col = columns
+    return [opening_col[opening] + " opening, "
+            + gauge_col[gauge] + " gauge, "
+            + members_col[n] + ": "
+            + gap_col[steps] + " gaps"
+            for opening, gauge, n, steps in kept]
+
 def receiver_platform():
     opening = (0, 43)
     gauge = (0, 0, 1, 8)
-    ret = []
-    for n in range(5, 11):
-        gap = (span - thickness * n) / (n + 1)
-        ret.append("With {} cross members, gaps will be {}."
-                .format(n, gap.show()))
-    return ret
+    return planner([opening], [gauge], range(5, 11))
+
+def test_planner():
+    """Checks gap_grid() and planner() against known answers then
+    sweeps 10" to 100" openings (in 1/8ths) against a few gauges
+    checking that no gap is shown as an unreduced whole inch ('/1'.)
+    Returns the number of rows checked.
+    """
+    rows = receiver_platform()
+    assert rows[0].endswith(' 5 members:  7"1/16 gaps'), rows[0]
+    assert rows[2].endswith(' 7 members:   5"1/4 gaps'), rows[2]
+    rows = planner([43], [(0, 0, 3, 4)], range(12),
+                   min_gap=(0, 3), max_gap=8, accuracy=8)
+    assert [row.split(', ')[2].split()[0] for row in rows] == [
+                                        '4', '6', '9'], rows
+    assert rows[0].split(': ')[1].strip() == '8" gaps', rows[0]
+    assert planner([43], [(0, 0, 1, 8)], range(12),
+                   min_gap=6, max_gap=5) == []
+    for bad_members in ([-2], [2.7]):
+        try:
+            gap_grid([10], [1], bad_members)
+        except ValueError:
+            pass
+        else:
+            assert False, "{} accepted".format(bad_members)
+    openings = [(0, 0, eighths, 8) for eighths in range(80, 801)]
+    gauges = [(0, 0, 1, 8), (0, 0, 3, 4), (0, 1, 1, 2)]
+    rows = planner(openings, gauges, range(1, 15))
+    for accuracy in (8, 16):
+        rows += planner(openings, gauges, range(1, 15),
+                        accuracy=accuracy)
+    for row in rows:
+        assert not '/1 ' in row, row
+    return len(rows)
 
 def show(inches):
     for inch in inches:
@@ -288,6 +426,7 @@ if __name__ == "__main__":
                 )
 
     #   test()
+    #   print(test_planner(), "planner rows checked.")
     #   show(my_dimensions)
     bad_code = """
     array = platform()
@@ -306,12 +445,11 @@ if __name__ == "__main__":
     opening = (0, 43)
     gauge = (0, 0, 1, 8)
     print("Number of openings     Size of gap")
-    data = []
-    for n in range(5, end + 1):
-        l = lay_out(opening, gauge, n)
-        data.append(l)
-    for n, item in enumerate(data, begin):
-        print("{:^19}     {:^11}".format(n, item[1].show()))
+    # n openings are separated by n - 1 cross members.
+    grid = gap_grid([opening], [gauge], range(begin - 1, end))
+    for _, _, members, gap in grid:
+        print("{:^19}     {:^11}"
+                .format(members + 1, Distance(0, gap).show()))
 
     which = int(input("Pick one to get a lay out: "))
     print("For span of {}, using {} dividers ({} openings) of gauge {}:"
@@ -320,7 +458,7 @@ if __name__ == "__main__":
                     which,
                     Distance(*gauge).show(inches_only=True)))
     print("The layout will be:")
-    for d in data[which-begin]:
+    for d in lay_out(opening, gauge, which):
         print('{}, '.format(d.show(inches_only=True)), end='')
     print()
     later = """